@@ -1,14 +1,195 @@
+import inspect
+import numpy as np
 import pandas as pd
 import pandas.testing as tm  # Import the testing module
 
+# Index and columns are validated once by _check_axes(), so the assertion can
+# skip re-checking them (only the options the installed pandas supports).
+_ASSERT_KWARGS = {
+    key: value
+    for key, value in {"check_index": False,
+                       "check_names": False,
+                       "check_freq": False}.items()
+    if key in inspect.signature(tm.assert_frame_equal).parameters
+}
+
+
+def _axis_equal(ax1: pd.Index, ax2: pd.Index) -> bool:
+    """Checks that two axes are equal (values, dtype, names and freq)."""
+    return (ax1.dtype == ax2.dtype
+            and ax1.names == ax2.names
+            and getattr(ax1, "freq", None) == getattr(ax2, "freq", None)
+            and ax1.equals(ax2))
+
+
+def _same_axes(df1: pd.DataFrame, df2: pd.DataFrame) -> bool:
+    """Checks that both DataFrames have equal index and columns."""
+    return _axis_equal(df1.index, df2.index) and _axis_equal(df1.columns, df2.columns)
+
+
+def _check_axes(df1: pd.DataFrame, df2: pd.DataFrame) -> bool:
+    """Validates index and columns once, printing any difference found."""
+    same_index = _axis_equal(df1.index, df2.index)
+    same_columns = _axis_equal(df1.columns, df2.columns)
+    if same_index and same_columns:
+        return True
+
+    print("DataFrames are different:")
+    if not same_index:
+        print("Index difference:")
+        print("df1 index:", df1.index)
+        print("df2 index:", df2.index)
+
+    if not same_columns:
+        print("Columns difference:")
+        print("df1 columns:", df1.columns)
+        print("df2 columns:", df2.columns)
+
+    return False
+
+
+def _same_buffer(v1, v2) -> bool:
+    """Checks (in O(1)) whether two arrays are views of exactly the same memory."""
+    if v1 is v2:
+        return True
+    if not (isinstance(v1, np.ndarray) and isinstance(v2, np.ndarray)):
+        return False
+    return (v1.dtype == v2.dtype and v1.shape == v2.shape
+            and v1.strides == v2.strides
+            and v1.__array_interface__["data"][0] == v2.__array_interface__["data"][0])
+
+
+def _blocks_equal(df1: pd.DataFrame, df2: pd.DataFrame) -> bool:
+    """
+    Compares the values of two DataFrames block by block with np.array_equal.
+
+    When the internal block layouts line up, the blocks are compared directly
+    (no copies). Otherwise the columns are grouped by dtype and each group is
+    compared as one 2D array. Returns False whenever a block cannot be compared
+    this way (e.g. object dtype), so the caller falls back to pandas.
+    """
+    try:
+        blocks1, blocks2 = df1._mgr.blocks, df2._mgr.blocks
+        same_layout = len(blocks1) == len(blocks2) and all(
+            b1.dtype == b2.dtype
+            and np.array_equal(b1.mgr_locs.as_array, b2.mgr_locs.as_array)
+            for b1, b2 in zip(blocks1, blocks2))
+
+        if same_layout:
+            pairs = ((b1.values, b2.values) for b1, b2 in zip(blocks1, blocks2))
+        else:
+            dtypes = df1.dtypes.to_numpy()
+            positions = (np.flatnonzero(dtypes == dtype) for dtype in pd.unique(dtypes))
+            pairs = ((df1.iloc[:, pos].to_numpy(), df2.iloc[:, pos].to_numpy())
+                     for pos in positions)
+
+        # shared buffers (e.g. shallow copies) are equal without reading them
+        return all(_same_buffer(v1, v2) or np.array_equal(v1, v2, equal_nan=True)
+                   for v1, v2 in pairs)
+    except (AttributeError, TypeError):
+        return False
+
+
+def _quick_compare(df1: pd.DataFrame, df2: pd.DataFrame):
+    """
+    Cheap pre-checks run before the (slow) pandas.testing assertion.
+
+    Returns:
+        bool or None: True if the DataFrames are identical, False if they
+        obviously differ, None if the full assertion is still needed.
+    """
+    # same object, or two DataFrames sharing one block manager (data and axes)
+    mgr1 = getattr(df1, "_mgr", None)
+    if df1 is df2 or (mgr1 is not None and mgr1 is getattr(df2, "_mgr", None)):
+        print("DataFrames are identical.")
+        return True
+
+    if df1.shape != df2.shape:
+        print("DataFrames are different:")
+        print(f"Shape difference: df1 - {df1.shape}, df2 - {df2.shape}")
+        return False
+
+    # compare the dtypes as plain object arrays (shapes are equal here)
+    dtypes1, dtypes2 = df1.dtypes.to_numpy(), df2.dtypes.to_numpy()
+    if not np.array_equal(dtypes1, dtypes2):
+        diff_cols = df1.columns[dtypes1 != dtypes2].tolist()
+        print("DataFrames are different:")
+        print(f"Column type differences: on columns : {diff_cols}")
+        return False
+
+    if _same_axes(df1, df2) and _blocks_equal(df1, df2):
+        print("DataFrames are identical.")
+        return True
+
+    return None
+
+
+def _with_timestamp_index(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns df with its PeriodIndex cast to a DatetimeIndex.
+
+    Only the index is replaced: a shallow copy shares the column data with df,
+    so nothing is duplicated and the caller's DataFrame keeps its index.
+    """
+    if not isinstance(df.index, pd.PeriodIndex):
+        return df
+
+    df_view = df.copy(deep=False)
+    df_view.index = df.index.to_timestamp()
+    return df_view
+
+
+def _diff_mask(df1: pd.DataFrame, df2: pd.DataFrame,
+               rtol: float = 0.0, atol: float = 0.0) -> np.ndarray:
+    """Element-wise difference mask of two numeric frames of the same shape.
+
+    Float columns are compared with np.isclose(rtol, atol); integer and bool
+    columns exactly, without a float64 round trip that would hide differences
+    beyond 2**53. Missing values (NaN/NA) are equal to each other only.
+    """
+    mask = np.zeros(df1.shape, dtype=bool)
+
+    # one vectorised pass per (dtype, dtype) pair, so no column is cast to another type
+    groups = {}
+    for j, dtypes in enumerate(zip(df1.dtypes, df2.dtypes)):
+        groups.setdefault(dtypes, []).append(j)
+
+    for (t1, t2), cols in groups.items():
+        s1, s2 = df1.iloc[:, cols], df2.iloc[:, cols]
+        na1, na2 = s1.isna().to_numpy(), s2.isna().to_numpy()
+
+        if pd.api.types.is_float_dtype(t1) and pd.api.types.is_float_dtype(t2):
+            ne = ~np.isclose(s1.to_numpy(dtype=np.float64, na_value=np.nan),
+                             s2.to_numpy(dtype=np.float64, na_value=np.nan),
+                             rtol=rtol, atol=atol)
+        elif isinstance(t1, np.dtype) and t1 == t2:
+            ne = s1.to_numpy() != s2.to_numpy()
+        else:
+            # nullable or mixed integer/bool columns: exact, column by column
+            ne = np.empty(s1.shape, dtype=bool)
+            for k in range(len(cols)):
+                col_ne = s1.iloc[:, k].array != s2.iloc[:, k].array
+                # nullable arrays return a BooleanArray with NA where a value is missing
+                ne[:, k] = (col_ne.to_numpy(dtype=bool, na_value=True)
+                            if hasattr(col_ne, "to_numpy") else np.asarray(col_ne, dtype=bool))
+
+        mask[:, cols] = np.where(na1 | na2, na1 != na2, ne)
+    return mask
+
+
 def compare_dataframes(df1:pd.DataFrame = None,
-                       df2: pd.DataFrame = None) -> None:
+                       df2: pd.DataFrame = None,
+                       rtol: float = 0.0,
+                       atol: float = 0.0) -> None:
     """
     Compares two DataFrames using pandas.testing and prints a detailed analysis.
 
     Args:
         df1 (pd.DataFrame): The first DataFrame.
         df2 (pd.DataFrame): The second DataFrame.
+        rtol (float): Relative tolerance for float columns when counting element-wise
+            differences; integer and bool columns are always compared exactly.
+        atol (float): Absolute tolerance for float columns, see rtol.
 
     Returns:
         None
@@ -21,10 +202,19 @@ def compare_dataframes(df1:pd.DataFrame = None,
     if not isinstance(df2, pd.DataFrame):
         raise(ValueError("df2 is not DataFrame!"))
 
+    # fast paths: same object, shape/dtype mismatch, equal blocks
+    if _quick_compare(df1, df2) is not None:
+        return
+
+    # index and columns are checked once here, not inside the assertion
+    # (shape and column types were already checked by _quick_compare)
+    if not _check_axes(df1, df2):
+        return
+
     # try-except block
     try:
         # Attempt to assert that DataFrames are equal
-        tm.assert_frame_equal(df1, df2)
+        tm.assert_frame_equal(df1, df2, **_ASSERT_KWARGS)
         print("DataFrames are identical.")
 
     except AssertionError as e:
@@ -32,39 +222,28 @@ def compare_dataframes(df1:pd.DataFrame = None,
         print(e)  # Print the AssertionError message
 
         # Further analysis:
-        # 1. Check for differences in shape
-        if df1.shape != df2.shape:
-            print(f"Shape difference: df1 - {df1.shape}, df2 - {df2.shape}")
-
-        # 2. Check for differences in index
-        if not df1.index.equals(df2.index):
-            print("Index difference:")
-            print("df1 index:", df1.index)
-            print("df2 index:", df2.index)
-
-        # 3. Check for differences in columns
-        if not df1.columns.equals(df2.columns):
-            print("Columns difference:")
-            print("df1 columns:", df1.columns)
-            print("df2 columns:", df2.columns)
-            
-        # 4. Check for differences in column types
-        df1_dtypes = df1.dtypes
-        df2_dtypes = df2.dtypes
-        
-        if not df1_dtypes.equals(df2_dtypes):
-            diff_cols = df1_dtypes.index[df1_dtypes != df2_dtypes]
-            print(f"Column type differences: on columns : {diff_cols.to_list()}")
-        
-        # 5. Check for exact element-wise differences
-        # (Optional, but can be expensive for large DataFrames)
-        try:
-            diff = df1.compare(df2)
-            print("Detailed element-wise differences:")
-            print(diff)
-        except ValueError:
-            # Handle ValueError for large differences
-            print("Too many element-wise differences to display.")
+        # Check for exact element-wise differences
+        all_numeric = all(pd.api.types.is_numeric_dtype(t)
+                          for t in (*df1.dtypes, *df2.dtypes))
+
+        if all_numeric:
+            # Numeric frames: vectorised NumPy comparison per column (NaN == NaN)
+            diff = _diff_mask(df1, df2, rtol=rtol, atol=atol)
+
+            print(f"Number of element-wise differences: {diff.sum()}")
+            # show only the first 20 differing cells
+            for row, col in np.argwhere(diff)[:20]:
+                print(f"  [{df1.index[row]}, {df1.columns[col]}]: "
+                      f"{df1.iat[row, col]} != {df2.iat[row, col]}")
+        else:
+            # (Optional, but can be expensive for large DataFrames)
+            try:
+                diff = df1.compare(df2)
+                print("Detailed element-wise differences:")
+                print(diff)
+            except ValueError:
+                # Handle ValueError for large differences
+                print("Too many element-wise differences to display.")
 
 
 
@@ -94,21 +273,13 @@ def compare_dfs(df1: pd.DataFrame = None,
     
     print(f"to_timestamp: {to_timestamp}")
 
-    # keeping sure no data manipulation happens on the real data
-    df1_copy = df1.copy()
-    df2_copy = df2.copy()
-
     if to_timestamp:
-        if isinstance(df1_copy.index, pd.PeriodIndex):
-            # cast PeriodIndex to DatetimeIndex
-            df1_copy.index = df1_copy.index.to_timestamp()
-
-        if isinstance(df2_copy.index, pd.PeriodIndex):
-            # cast PeriodIndex to DatetimeIndex
-            df2_copy.index = df2_copy.index.to_timestamp()
+        # cast PeriodIndex to DatetimeIndex (the real data is not modified)
+        df1 = _with_timestamp_index(df1)
+        df2 = _with_timestamp_index(df2)
     
     # compare dataframe
-    compare_dataframes(df1_copy, df2_copy)
+    compare_dataframes(df1, df2)
 
 
 # Example
@@ -148,17 +319,21 @@ def cmp_dfs(df1: pd.DataFrame,
     print(f"to_timestamp: {to_timestamp}")
 
     if to_timestamp:
-        if isinstance(df1.index, pd.PeriodIndex):
-            # cast PeriodIndex to DatetimeIndex
-            df1.index = df1.index.to_timestamp()
-
-        if isinstance(df2.index, pd.PeriodIndex):
-            # cast PeriodIndex to DatetimeIndex
-            df2.index = df2.index.to_timestamp()
+        # cast PeriodIndex to DatetimeIndex (the real data is not modified)
+        df1 = _with_timestamp_index(df1)
+        df2 = _with_timestamp_index(df2)
     
+    # fast paths: same object, shape/dtype mismatch, equal blocks
+    if _quick_compare(df1, df2) is not None:
+        return
+
+    # index and columns are checked once here, not inside the assertion
+    if not _check_axes(df1, df2):
+        return
+
     # compare dataframe
     try:
-        tm.assert_frame_equal(df1, df2)
+        tm.assert_frame_equal(df1, df2, **_ASSERT_KWARGS)
         print("DataFrames are identical.")
     except AssertionError as e:
         print("DataFrames are different:")
@@ -1,5 +1,7 @@
+import math
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 
 def calculate_cumulative_inflation_implied_inflation(principal_value: float = None,
                                                      current_value: float = None,
@@ -26,8 +28,12 @@ def calculate_cumulative_inflation_implied_inflation(principal_value: float = No
     print(f"Current value: {currency_symbol}{current_value:,}")
     print(f"Implied inflation: {implied_inflation:.2%}")
 
-    # Break-even future value
-    FV = principal_value * (1 + implied_inflation) ** n
+    # Break-even future value: (1 + i) ** n computed as exp(n * log1p(i)),
+    # which stays accurate for small inflation rates; log1p is undefined for i <= -1
+    if implied_inflation > -1:
+        FV = principal_value * math.exp(n * math.log1p(implied_inflation))
+    else:
+        FV = principal_value * (1 + implied_inflation) ** n
     print(f"Break-Even Future Value: {currency_symbol}{FV:,.2f}")
 
     # Difference in value
@@ -70,3 +76,62 @@ def calculate_cumulative_inflation(principal_value: float = None,
         print(f"Loss of: {currency_symbol}{abs(diff):,.2f}")
     else:
         print(f"Profit of: {currency_symbol}{diff:,.2f}")
+
+
+@lru_cache(maxsize=None)
+def _future_value_kernel():
+    """Compiles the numba kernel once, returns None if numba is not installed."""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True)
+    def _fv_vec(pv, i, n, out):
+        for k in prange(pv.size):
+            if i[k] > -1:
+                out[k] = pv[k] * np.exp(n[k] * np.log1p(i[k]))
+            else:
+                out[k] = pv[k] * (1 + i[k]) ** n[k]
+
+    return _fv_vec
+
+
+def calculate_cumulative_inflation_vec(principal_value=None,
+                                       implied_inflation=None,
+                                       n=10) -> np.ndarray:
+    """
+    Calculate break-even future values for many assets at once using implied inflation.
+
+    Vectorised version of the formula used in
+    calculate_cumulative_inflation_implied_inflation(). Inputs are broadcast
+    against each other; the loop is JIT-compiled with numba when it is
+    installed, otherwise plain NumPy broadcasting is used. (1 + i) ** n is
+    evaluated as exp(n * log1p(i)), which agrees with the power form to within
+    floating-point rounding and is more accurate for small rates; rates of
+    -100% or below use the power form directly.
+
+    Args:
+        principal_value: Initial values of the assets (array-like, default is None).
+        implied_inflation: Average implied inflation rates (array-like, default is None).
+        n: Number of years (scalar or array-like, default is 10).
+
+    Returns:
+        np.ndarray: Break-even future values, in the broadcast shape of the inputs.
+    """
+    if principal_value is None or implied_inflation is None:
+        raise ValueError("principal_value and implied_inflation cannot be None!")
+
+    pv, i, n = np.broadcast_arrays(np.asarray(principal_value, dtype=np.float64),
+                                   np.asarray(implied_inflation, dtype=np.float64),
+                                   np.asarray(n, dtype=np.float64))
+
+    kernel = _future_value_kernel()
+    if kernel is None:
+        # log1p is undefined for i <= -1, use the power form there
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return pv * np.where(i > -1, np.exp(n * np.log1p(i)), (1 + i) ** n)
+
+    out = np.empty(pv.shape)
+    kernel(pv.ravel(), i.ravel(), n.ravel(), out.reshape(-1))
+    return out
@@ -1,166 +1,656 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
+import bisect
+import csv
+import hashlib
 import os
-import time
+import re
 from typing import Union, Dict
 import requests
+import shutil
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm.auto import tqdm  # Works in both Colab and scripts
-
-
-
-def download_data(url, file_path):
+from tqdm.utils import CallbackIOWrapper
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# yfinance writes daily indices as plain dates, e.g. "2020-02-03"
+_DATE_ONLY = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Shared session so repeated downloads (also across worker threads) reuse
+# keep-alive connections; transient failures are retried with backoff
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_maxsize=32,
+                       max_retries=Retry(total=3, backoff_factor=0.3,
+                                         status_forcelist=(429, 500, 502, 503, 504)))
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Freshness checks (HEAD) fail fast instead: no retries, short timeout
+_HEAD_SESSION = requests.Session()
+_HEAD_ADAPTER = HTTPAdapter(pool_maxsize=32, max_retries=Retry(total=0))
+_HEAD_SESSION.mount("https://", _HEAD_ADAPTER)
+_HEAD_SESSION.mount("http://", _HEAD_ADAPTER)
+_HEAD_TIMEOUT = 5
+
+# _check_remote() results
+_CHANGED = "changed"  # different ETag on the server: download the whole file again
+_SIZE = "size"        # same version but a different size: e.g. an interrupted download
+
+
+def _show_progress() -> bool:
+    """Progress bars are drawn on a terminal or in a notebook, unless DISABLE_TQDM is set."""
+    if os.environ.get("DISABLE_TQDM"):
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty()) or "ipykernel" in sys.modules
+
+
+def _request_download(url: str, file_path: str, resume: bool) -> requests.Response:
+    """Starts a streaming GET, asking only for the missing bytes when resuming.
+
+    The Range request carries If-Range with the validator (ETag or Last-Modified)
+    saved when the partial file was started, so a file that changed on the
+    server in the meantime comes back whole (200) instead of being spliced.
+    """
+    partial_path = file_path + ".partial"
+    offset = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+    if resume and offset > 0 and os.path.exists(partial_path):
+        with open(partial_path) as file:
+            validator = file.read().strip()
+        # identity: byte offsets refer to the decoded file
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator,
+                   "Accept-Encoding": "identity"}
+        response = _SESSION.get(url, headers=headers, stream=True, timeout=30)
+        if response.status_code != 416:
+            return response
+        response.close()  # offset not satisfiable (e.g. file shrank), start over
+
+    return _SESSION.get(url, stream=True, timeout=30)
+
+
+def download_data(url, file_path, position=None, resume=False):
     """Downloads a file with an interactive progress bar (real-time in Colab too).
 
-    Works in Jupyter/Colab notebooks and standalone Python scripts.
+    Works in Jupyter/Colab notebooks and standalone Python scripts. When stdout
+    is not a terminal (pipes, CI logs) or DISABLE_TQDM is set, no bar is drawn
+    and a single summary line is printed instead.
 
     Args:
         url (str): The file URL to download.
         file_path (str): The local path where the file will be saved.
+        position (int, optional): Line offset of the progress bar, used when
+            several files are downloaded concurrently. Defaults to None.
+        resume (bool, optional): Continue an interrupted download of file_path with
+            an HTTP Range request. Servers without range support send the whole
+            file, which then replaces the partial one. Defaults to False.
     """
-    response = requests.get(url, stream=True)
-    total_size = int(response.headers.get("content-length", 0))  # Get file size
-    chunk_size = 1024 * 2 # 2 KB chunks
+    # a stale ETag must not vouch for a partially written file
+    etag_path = file_path + ".etag"
+    if os.path.exists(etag_path):
+        os.remove(etag_path)
+    partial_path = file_path + ".partial"
+
+    with _request_download(url, file_path, resume) as response:
+        response.raise_for_status()
+        # 206: the body continues the local file, anything else replaces it
+        offset = os.path.getsize(file_path) if response.status_code == 206 else 0
+        total_size = int(response.headers.get("content-length", 0))  # Get file size
+        if total_size:
+            total_size += offset
+        chunk_size = 1024 * 1024 # 1 MB copy buffer
+
+        # remember what this download belongs to, so an interruption can resume it
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        if validator:
+            with open(partial_path, "w") as file:
+                file.write(validator)
+
+        # Create tqdm progress bar (tqdm throttles redraws itself)
+        progress_bar = None
+        if _show_progress():
+            progress_bar = tqdm(
+                total=total_size or None,  # Handle unknown size
+                initial=offset,
+                unit="B",
+                unit_scale=True,
+                unit_divisor=1024,
+                desc=Path(file_path).name,  # More readable
+                leave=True,
+                position=position,
+                mininterval=0.2,
+                miniters=1,
+                dynamic_ncols=True
+            )
+
+        # Stream the raw body to disk, updating the bar on every read
+        response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+        with open(file_path, "ab" if offset else "wb") as file:
+            source = response.raw
+            if progress_bar is not None:
+                source = CallbackIOWrapper(progress_bar.update, response.raw, "read")
+            shutil.copyfileobj(source, file, length=chunk_size)
+
+        # remember the ETag for conditional checks on later runs
+        etag = response.headers.get("ETag")
+        if etag:
+            with open(etag_path, "w") as file:
+                file.write(etag)
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+        if progress_bar is not None:
+            progress_bar.close()
+        else:
+            # one write per line, so concurrent downloads don't interleave
+            print(f"Downloaded {Path(file_path).name} ({os.path.getsize(file_path)} bytes)\n", end="")
 
-    # Create tqdm progress bar
-    progress_bar = tqdm(
-        total=total_size or None,  # Handle unknown size
-        unit="B",
-        unit_scale=True,
-        unit_divisor=1024,
-        desc=Path(file_path).name,  # More readable
-        leave=True
-    )
 
-    # Write file in chunks
-    with open(file_path, "wb") as file:
-        for chunk in response.iter_content(chunk_size=chunk_size):
-            if chunk:  # Only update if data is received
-                file.write(chunk)
-                progress_bar.update(len(chunk))  # Update progress bar
-                sys.stdout.flush()  # Force immediate update in Colab
 
-    progress_bar.close()
 
+def _check_remote(file_path: str, url: str, session=_HEAD_SESSION) -> Union[str, None]:
+    """Checks a local file against the server with a HEAD request.
 
+    Returns _CHANGED if the server sends an ETag other than the one stored next
+    to the file (a new version, even of the same size), _SIZE if the remote
+    Content-Length differs from the local size (e.g. a truncated download, see
+    download_data(resume=True)), or None if the file is up to date. The stored
+    ETag is sent as If-None-Match, so an unchanged file costs a 304 response
+    with no body. If the server cannot be reached the local file is kept.
+    """
+    # identity: compare with the decoded size, not a gzip transfer size
+    headers = {"Accept-Encoding": "identity"}
+    etag = None
+    etag_path = file_path + ".etag"
+    if os.path.exists(etag_path):
+        with open(etag_path) as file:
+            etag = file.read().strip()
+        headers["If-None-Match"] = etag
+
+    try:
+        response = session.head(url, headers=headers, allow_redirects=True,
+                                timeout=_HEAD_TIMEOUT)
+    except requests.RequestException as e:
+        # one write per line, the checks run in worker threads
+        print(f"Could not check {Path(file_path).name} against {url}: {e}\n", end="")
+        return None
+
+    if response.status_code == 304 or not response.ok:
+        return None
+
+    remote_etag = response.headers.get("ETag")
+    if etag and remote_etag and remote_etag != etag:
+        return _CHANGED
+
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and int(content_length) != os.path.getsize(file_path):
+        return _SIZE
+    return None
+
+
+def _validate_file_path(file_path: Dict) -> None:
+    """Raises ValueError if file_path is None, not a dictionary, or empty."""
+    if file_path is None:
+        raise ValueError("file_path cannot be None")
+    if not isinstance(file_path, dict):
+        raise ValueError("file_path must be a dictionary")
+    if len(file_path) == 0:
+        raise ValueError("file_path cannot be empty")
 
 
-def load_raw_data(file_path: Dict = None, out_dir: str = "") -> dict:
+def file_sha256(file_path: str) -> str:
+    """Returns the SHA-256 hex digest of a file.
+
+    Args:
+        file_path (str): Path of the file to hash.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    with open(file_path, "rb") as file:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(file, "sha256").hexdigest()
+
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def load_raw_data(file_path: Dict = None,
+                  out_dir: str = "",
+                  checksums: Dict[str, str] = None,
+                  max_workers: int = 8) -> dict:
     """Downloads raw data files if they don't exist locally and renames keys.
 
     Args:
         file_path (dict, optional): Dictionary mapping file names to URLs. Defaults to None.
         out_dir (str, optional): Directory to save files. Defaults to "".
+        checksums (dict, optional): Dictionary mapping file names to SHA-256 hex digests.
+            Existing files whose digest does not match are downloaded again, and
+            downloaded files are verified as well. Files without a checksum are
+            compared with the server's ETag and Content-Length instead (HEAD requests
+            run in the download pool). Defaults to None.
+        max_workers (int, optional): Maximum number of concurrent downloads (capped at 32
+            to avoid rate limiting). Defaults to 8.
 
     Raises:
-        ValueError: If file_path is None, not a dictionary, or empty.
+        ValueError: If file_path is None, not a dictionary, or empty, or if a
+            downloaded file does not match its checksum.
 
     Returns:
         dict: Updated file_path dictionary with renamed keys.
     """
     # Input validation
-    if file_path is None:
-        raise ValueError("file_path cannot be None")
-    if not isinstance(file_path, dict):
-        raise ValueError("file_path must be a dictionary")
-    if len(file_path) == 0:
-        raise ValueError("file_path cannot be empty")
+    _validate_file_path(file_path)
 
     # Ensure output directory is absolute path
     out_dir = os.path.abspath(out_dir)
-    if len(out_dir) > 0:
-        os.makedirs(out_dir, exist_ok=True)
+    os.makedirs(out_dir, exist_ok=True)
+
+    return _load_raw_data(file_path, out_dir, checksums, max_workers)
+
 
-    # Rename keys and download files
+def _load_raw_data(file_path: Dict,
+                   out_dir: str,
+                   checksums: Dict[str, str] = None,
+                   max_workers: int = 8) -> dict:
+    """load_raw_data() for a validated file_path and an existing, absolute out_dir."""
+    # Rename keys and collect missing files
     updated_file_path = {}
+    pending = []  # (url, path, resume) to download
+    to_check = []  # (url, path) to compare with the server
+    checksums = checksums or {}
+    expected_by_path = {}
     for file_name, file_url in file_path.items():
         new_file_name = os.path.join(out_dir, file_name)
         updated_file_path[new_file_name] = file_url
+        expected = checksums.get(file_name)
+        if expected is not None:
+            expected_by_path[new_file_name] = expected
 
         if not os.path.exists(new_file_name):
-            # command = f'wget "{file_url}" -O "{new_file_name}" -q --show-progress'
-            # os.system(command)
-            download_data(file_url, new_file_name)
+            pending.append((file_url, new_file_name, False))
+        elif expected is not None and file_sha256(new_file_name) != expected.lower():
+            print(f"{new_file_name} checksum mismatch, downloading again")
+            pending.append((file_url, new_file_name, False))
+        elif expected is None:
+            to_check.append((file_url, new_file_name))
         else:
             print(f"{new_file_name} already exists")
 
+    # HEAD checks and downloads share one pool (I/O bound, one bar per download)
+    if pending or to_check:
+        workers = max(1, min(max_workers, 32, len(pending) + len(to_check)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                downloads = [executor.submit(download_data, file_url, new_file_name, position, resume)
+                             for position, (file_url, new_file_name, resume) in enumerate(pending)]
+                checks = {executor.submit(_check_remote, new_file_name, file_url): (file_url, new_file_name)
+                          for file_url, new_file_name in to_check}
+
+                for future in as_completed(checks):
+                    file_url, new_file_name = checks[future]
+                    status = future.result()
+                    if status is None:
+                        print(f"{new_file_name} already exists")
+                        continue
+
+                    # resume only within the same version, and only if the download recorded one
+                    resume = status == _SIZE and os.path.exists(new_file_name + ".partial")
+                    if status == _CHANGED:
+                        print(f"{new_file_name} changed on the server, downloading again")
+                    elif resume:
+                        print(f"{new_file_name} differs in size from the server, resuming download")
+                    else:
+                        print(f"{new_file_name} differs in size from the server, downloading again")
+                    downloads.append(executor.submit(download_data, file_url, new_file_name,
+                                                     len(pending), resume))
+                    pending.append((file_url, new_file_name, resume))
+
+                # re-raise the first failed download as soon as it finishes
+                for future in as_completed(downloads):
+                    future.result()
+            except BaseException:
+                # don't start queued downloads after a failure (or Ctrl-C); only the
+                # ones already running are waited for when the pool shuts down
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    # a fresh download must match its checksum too (stale manifest, bad file on the server)
+    for _, new_file_name, _ in pending:
+        expected = expected_by_path.get(new_file_name)
+        if expected is not None and file_sha256(new_file_name) != expected.lower():
+            raise ValueError(f"Downloaded {new_file_name} does not match its SHA-256 checksum")
+
     return updated_file_path
 
 
+def _parse_dates(index: pd.Index) -> pd.DatetimeIndex:
+    """Parses date strings to naive datetimes, picking the format from the first value."""
+    if len(index) > 0 and _DATE_ONLY.fullmatch(str(index[0])):
+        # daily data: plain dates, no timezone to convert
+        try:
+            return pd.to_datetime(index, format="%Y-%m-%d", cache=True)
+        except ValueError:
+            pass  # mixed formats, use the generic ISO parser
+
+    return pd.to_datetime(index, utc=True, format="ISO8601", cache=True).tz_localize(None)
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts the date strings index to naive datetimes and names the axes."""
+    df.index = _parse_dates(df.index)
+    df.index.name = "Date"
+    df.columns.names = ['Price', 'Ticker']
+    return df
+
+
+def _cast_prices(df: pd.DataFrame, float_dtype: str) -> pd.DataFrame:
+    """Casts float64 price columns to float_dtype; Volume columns keep their type."""
+    if float_dtype == "float64":
+        return df
+    prices = [col for col, dtype in df.dtypes.items()
+              if col[0] != "Volume" and dtype == "float64"]
+    return df.astype({col: float_dtype for col in prices}) if prices else df
+
+
+def _read_csv_chunked(file_name: str, chunksize: int = 500_000,
+                      float_dtype: str = "float64") -> pd.DataFrame:
+    """Reads an OHLC CSV with the pandas C engine, normalising it chunk by chunk.
+
+    Only one chunk of raw date strings is held at a time, which keeps peak
+    memory low for very long files.
+    """
+    with pd.read_csv(file_name, header=[0, 1], index_col=0, chunksize=chunksize) as reader:
+        chunks = [_cast_prices(_normalize(chunk), float_dtype) for chunk in reader]
+    return chunks[0] if len(chunks) == 1 else pd.concat(chunks, axis=0, sort=False)
+
+
+def _read_ohlc_csv(file_name: str, float_dtype: str = "float64") -> pd.DataFrame:
+    """Reads a yfinance OHLC CSV (``Price``/``Ticker`` header rows + ``Date`` row).
+
+    Uses pyarrow's multi-threaded CSV reader when pyarrow is installed and
+    falls back to the (chunked) pandas C engine otherwise (or for other CSV
+    layouts). pandas' own ``engine="pyarrow"`` does not support multi-row
+    headers, so the two header rows are parsed here and the MultiIndex is rebuilt.
+
+    Args:
+        file_name (str): Path of the CSV file.
+        float_dtype (str, optional): dtype of the price columns, "float64" or
+            "float32". Defaults to "float64".
+
+    Raises:
+        pd.errors.EmptyDataError: If the file is empty.
+
+    Returns:
+        pd.DataFrame: Data with a "Date" DatetimeIndex and ("Price", "Ticker") columns.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return _read_csv_chunked(file_name, float_dtype=float_dtype)
+
+    # First three rows: level 0 names, level 1 names, index name row
+    with open(file_name, newline="") as file:
+        reader = csv.reader(file)
+        header = [next(reader, None) for _ in range(3)]
+
+    if header[0] is None:
+        raise pd.errors.EmptyDataError(f"No columns to parse from file {file_name}")
+
+    price, ticker, index_row = header
+    if (ticker is None or index_row is None or len(price) != len(ticker)
+            or not index_row[0] or any(index_row[1:])):
+        # not the yfinance layout, let pandas handle it
+        return _read_csv_chunked(file_name, float_dtype=float_dtype)
+
+    # positional names keep duplicated header labels apart
+    names = [f"c{i}" for i in range(len(price))]
+    read_options = pa_csv.ReadOptions(skip_rows=3, column_names=names,
+                                      block_size=8 << 20)
+
+    # Explicit types let the streaming reader skip inference: prices are
+    # float_dtype, volumes int64 (pandas turns them into float64 only if they have gaps)
+    price_type = pa.from_numpy_dtype(np.dtype(float_dtype))
+    column_types = {names[0]: pa.string()}
+    column_types.update({name: pa.int64() if level == "Volume" else price_type
+                         for name, level in zip(names[1:], price[1:])})
+
+    try:
+        # stream the file block by block instead of materialising it at once
+        reader = pa_csv.open_csv(file_name, read_options=read_options,
+                                 convert_options=pa_csv.ConvertOptions(column_types=column_types))
+        table = pa.Table.from_batches(list(reader), schema=reader.schema)
+    except pa.ArrowInvalid:
+        # a value did not match the expected type, let Arrow infer the types
+        table = pa_csv.read_csv(
+            file_name,
+            read_options=read_options,
+            convert_options=pa_csv.ConvertOptions(column_types={names[0]: pa.string()})
+        )
+
+    # all-empty columns are inferred as null, pandas reads them as float64
+    table = table.cast(pa.schema([
+        field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+        for field in table.schema
+    ]))
+
+    # release Arrow buffers column by column while converting
+    df = table.to_pandas(self_destruct=True, split_blocks=True).set_index(names[0])
+    del table
+    df.index.name = index_row[0]
+    df.columns = pd.MultiIndex.from_arrays([price[1:], ticker[1:]],
+                                           names=[price[0], ticker[0]])
+    # no-op unless the inferring fallback produced float64 prices
+    return _cast_prices(_normalize(df), float_dtype)
+
+
+def _load_ohlc_file(file_name: str, float_dtype: str = "float64") -> pd.DataFrame:
+    """Loads a downloaded OHLC CSV, using a Parquet copy beside it when fresh.
+
+    The first load parses the CSV, normalises the index to naive datetimes and
+    writes ``<file_name>.parquet``; later loads read that file instead as long
+    as it is newer than the CSV. Caching is skipped if no Parquet engine is
+    installed.
+
+    Args:
+        file_name (str): Path of the CSV file.
+        float_dtype (str, optional): dtype of the price columns, see _read_ohlc_csv().
+            Each dtype has its own Parquet copy. Defaults to "float64".
+
+    Returns:
+        pd.DataFrame: Data with a "Date" DatetimeIndex and ("Price", "Ticker") columns.
+    """
+    suffix = "" if float_dtype == "float64" else f".{float_dtype}"
+    pq_path = f"{file_name}{suffix}.parquet"
+    if (os.path.exists(pq_path)
+            and os.path.getmtime(pq_path) >= os.path.getmtime(file_name)):
+        try:
+            df = pd.read_parquet(pq_path)
+            df.columns = pd.MultiIndex.from_tuples(df.columns, names=['Price', 'Ticker'])
+            return df
+        except (ImportError, ValueError, OSError):
+            pass  # unreadable cache, parse the CSV again
+
+    df = _read_ohlc_csv(file_name, float_dtype)
+
+    try:
+        df.to_parquet(pq_path, compression="zstd", index=True)
+    except (ImportError, ValueError, OSError) as e:
+        print(f"Could not cache {Path(file_name).name} as parquet: {e}")
+
+    return df
+
+
+def _align_columns(df: pd.DataFrame, columns: pd.Index) -> pd.DataFrame:
+    """Puts df's columns in the given order when both hold the same set of columns.
+
+    Frames with identical columns are stacked by concat without reindexing; other
+    column sets are left alone so concat still takes their union.
+    """
+    if df.columns.equals(columns) or len(df.columns) != len(columns) \
+            or not df.columns.isin(columns).all():
+        return df
+    return df.reindex(columns=columns)
+
+
 def load_git_data(file_path: Dict = None,
                   interval: Union[str, None] = None,
                   out_dir: str = "",
-                  debug: bool =False) -> pd.DataFrame:
+                  debug: bool =False,
+                  checksums: Dict[str, str] = None,
+                  force_refresh: bool = False,
+                  colab_fs_sync: bool = False,
+                  float_dtype: str = "float64") -> pd.DataFrame:
     """
     Loads data from a Git repository for reproducibility.
 
+    The result is cached in ``out_dir`` as a Parquet file keyed on the URLs, the
+    interval, float_dtype and the size and modification time of every local
+    file. Each call first checks the local files against the server (HEAD
+    requests, or ``checksums``, see load_raw_data()), so a file that changed
+    upstream is downloaded again and the cached result is rebuilt; otherwise it
+    is returned without parsing anything.
+
     Args:
         file_path (dict, optional): Dictionary mapping filenames to URLs. Defaults to None.
         interval (str, optional): Data interval ('1d', etc.). Defaults to None.
         out_dir (str, optional): Output directory. Defaults to "".
+        checksums (dict, optional): Dictionary mapping filenames to SHA-256 hex digests,
+            see load_raw_data(). Defaults to None.
+        force_refresh (bool, optional): Ignore the cached result and rebuild it.
+            Defaults to False.
+        colab_fs_sync (bool, optional): Call os.sync() after downloading, for file systems
+            (e.g. mounted Colab drives) that show new files late. Defaults to False.
+        float_dtype (str, optional): dtype of the price columns. "float32" halves their
+            memory at ~7 significant digits; Volume columns are not affected.
+            Defaults to "float64".
 
     Raises:
-        ValueError: If file_path is None, not a dictionary, or empty.
+        ValueError: If file_path is None, not a dictionary, or empty, or if a
+            downloaded file does not match its checksum.
 
     Returns:
         pd.DataFrame: Loaded data.
     """
     # Input validation
-    if file_path is None:
-        raise ValueError("file_path cannot be None")
-    if not isinstance(file_path, dict):
-        raise ValueError("file_path must be a dictionary")
-    if len(file_path) == 0:
-        raise ValueError("file_path cannot be empty")
+    _validate_file_path(file_path)
+    if float_dtype not in ("float64", "float32"):
+        raise ValueError(f"float_dtype must be 'float64' or 'float32', got {float_dtype!r}")
 
-    # Convert to absolute path
+    # Convert to absolute path, once for the downloads and the cache lookup
     out_dir = os.path.abspath(out_dir)
 
-    # Download raw files and get updated file_path
-    updated_file_path = load_raw_data(file_path, out_dir)
+    # Download missing or changed raw files and get updated file_path
+    os.makedirs(out_dir, exist_ok=True)
+    updated_file_path = _load_raw_data(file_path, out_dir, checksums)
 
     if debug:
         # Debugging output
         print("\n\n", "**" * 15)
         print("\n$ls -lh")
         print(f"DEBUG: out_dir = {out_dir}")
-        print(f"DEBUG: Absolute path = {os.path.abspath(out_dir)}")
         print(f"DEBUG: Directory exists? {os.path.exists(out_dir)}")
         print(f"DEBUG: Contents of {out_dir}: {os.listdir(out_dir) if os.path.exists(out_dir) else 'Directory missing'}")
 
-    # Sleep to prevent Colab caching issues
-    time.sleep(1)
+    # Flush pending writes so the new files are visible (Colab FS caching issues)
+    if colab_fs_sync and hasattr(os, "sync"):
+        os.sync()
+
+    # Return the cached result of an identical earlier call on the same local files
+    args_key = hashlib.sha1("|".join(sorted(file_path.values()) + [str(interval), float_dtype])
+                            .encode()).hexdigest()[:16]
+    stats = [(name, os.stat(name)) for name in sorted(updated_file_path)]
+    files_key = hashlib.sha1("|".join(f"{name}:{st.st_size}:{st.st_mtime_ns}" for name, st in stats)
+                             .encode()).hexdigest()[:16]
+    cache_path = os.path.join(out_dir, f".cache_{args_key}_{files_key}.parquet")
+    if os.path.exists(cache_path) and not force_refresh:
+        try:
+            data = pd.read_parquet(cache_path)
+            print(f"Loaded cached data from {cache_path}")
+            print("\n\ndata shape : ", data.shape)
+            return data
+        except (ImportError, ValueError, OSError):
+            pass  # unreadable cache, rebuild it
 
     # List files
-    ls_files(path=out_dir)
+    ls_files(path=out_dir, hide_sidecars=True)
     print("\n\n", "**" * 15)
 
-    # Read and concatenate data
-    data = pd.DataFrame()
+    # Read each file, then concatenate once
+    frames = []
     for file_name in updated_file_path.keys():
         try:
-            df = pd.read_csv(f"{file_name}", header=[0, 1], index_col=0)
+            df = _load_ohlc_file(file_name, float_dtype)
         except pd.errors.EmptyDataError:
             print(f"Skipping empty file: {file_name}")
             continue
         file = Path(file_name)
         print(f"shape of df from {file.name} :  {df.shape}")
+        if frames:
+            df = _align_columns(df, frames[0].columns)
+        frames.append(df)
 
-        # Process data
-        df.index = pd.to_datetime(df.index, utc=True).tz_localize(None)
-        if interval == "1d":
-            df.index = df.index.to_period('D')
-        df.index.name = "Date"
-        df.columns.names = ['Price', 'Ticker']
-        data = pd.concat([data, df])
+    data = pd.concat(frames, axis=0, sort=False) if frames else pd.DataFrame()
+
+    # Process data: one period conversion on the concatenated DatetimeIndex
+    if interval == "1d" and frames:
+        data.index = data.index.to_period('D')
+
+    if frames:
+        try:
+            data.to_parquet(cache_path, compression="zstd")
+        except (ImportError, ValueError, OSError) as e:
+            print(f"Could not cache data as parquet: {e}")
+        else:
+            # results built from older versions of the same files can't be hit again
+            with os.scandir(out_dir) as it:
+                for entry in it:
+                    if (entry.name.startswith(f".cache_{args_key}_")
+                            and entry.path != cache_path):
+                        os.remove(entry.path)
 
     print("\n\ndata shape : ", data.shape)
     return data
 
 
-def ls_files(path=".", debug=False):
-    """Lists files in the specified directory with their sizes."""
+# ls_files size units: (divisor, suffix), selected by bisecting _SIZE_BOUNDS
+_SIZE_BOUNDS = [1024, 1048576]
+_SIZE_UNITS = ((1, "B"), (1024, "K"), (1048576, "M"))
+
+
+def _format_size(size):
+    """Formats a byte count as e.g. '512B', '3.50K' or '12.00M'."""
+    divisor, suffix = _SIZE_UNITS[bisect.bisect_right(_SIZE_BOUNDS, size)]
+    if divisor == 1:
+        return f"{size}{suffix}"
+    return f"{size / divisor:.2f}{suffix}"
+
+
+# Bookkeeping files written next to downloaded data: <file>.etag, <file>.partial,
+# <file>.parquet / <file>.float32.parquet and load_git_data()'s .cache_<key>_<key>.parquet
+_SIDECAR_SUFFIX = re.compile(r"\.(etag|partial|parquet|float32\.parquet)$")
+_RESULT_CACHE = re.compile(r"\.cache_[0-9a-f]{16}_[0-9a-f]{16}\.parquet")
+
+
+def _is_sidecar(name, names):
+    """True for a bookkeeping file whose data file is also in names, or a result cache."""
+    if _RESULT_CACHE.fullmatch(name):
+        return True
+    match = _SIDECAR_SUFFIX.search(name)
+    return match is not None and name[:match.start()] in names
+
+
+def ls_files(path=".", debug=False, hide_sidecars=False):
+    """Lists files in the specified directory with their sizes.
+
+    With hide_sidecars=True the ETag, partial-download and Parquet cache files
+    that load_git_data() keeps next to the data files are left out.
+    """
     path = os.path.abspath(path)  # Convert to absolute path
     print(f"\n\nChecking files in directory: {path}")
 
@@ -168,28 +658,29 @@ def ls_files(path=".", debug=False):
         print("Directory does not exist.", flush=True)
         return
 
-    files = os.listdir(path)
+    # single directory scan, file types come cached with each entry
+    with os.scandir(path) as it:
+        entries = list(it)
 
     if debug:
-        print(f"Files found: {files}", flush=True)  # Debug print
+        print(f"Files found: {[entry.name for entry in entries]}", flush=True)  # Debug print
 
-    if not files:
+    if hide_sidecars:
+        names = {entry.name for entry in entries}
+        entries = [entry for entry in entries if not _is_sidecar(entry.name, names)]
+
+    if not entries:
         print("No files found in directory.", flush=True)
         return
 
-    for filename in files:
-        filepath = os.path.join(path, filename)
-        if os.path.isfile(filepath):
-            size = os.path.getsize(filepath)
-            if size >= 1048576:
-                print(f"{filename} {size / 1048576:.2f}M")
-            elif size >= 1024:
-                print(f"{filename} {size / 1024:.2f}K")
-            else:
-                # print(f"{filename} {size}B", flush=True)
-                print(f"{filename} {size}B")
+    lines = []
+    for entry in entries:
+        if entry.is_file():
+            lines.append(f"{entry.name} {_format_size(entry.stat().st_size)}")
         else:
-            print(f"{filename} (Not a file, might be a directory)")
+            lines.append(f"{entry.name} (Not a file, might be a directory)")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+from df_compare import compare_dataframes
+
+
+def _differences(capsys):
+    out = capsys.readouterr().out
+    line = next(l for l in out.splitlines() if l.startswith("Number of element-wise differences"))
+    return int(line.rsplit(":", 1)[1])
+
+
+def test_int64_differences_are_counted(capsys):
+    df1 = pd.DataFrame({"a": np.array([100_000_000, 2**53, 1], dtype=np.int64)})
+    df2 = pd.DataFrame({"a": np.array([100_000_001, 2**53 + 1, 1], dtype=np.int64)})
+    compare_dataframes(df1, df2)
+    assert _differences(capsys) == 2
+
+
+def test_nullable_int_and_float_columns(capsys):
+    df1 = pd.DataFrame({"a": pd.array([1, None, 3], dtype="Int64"),
+                        "b": [1.0, np.nan, 3.0]})
+    df2 = pd.DataFrame({"a": pd.array([1, None, 4], dtype="Int64"),
+                        "b": [1.0, np.nan, 3.0 + 1e-12]})
+    compare_dataframes(df1, df2)
+    assert _differences(capsys) == 2
+
+    compare_dataframes(df1, df2, atol=1e-9)
+    assert _differences(capsys) == 1
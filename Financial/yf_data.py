@@ -1,7 +1,13 @@
 import pandas as pd
-from typing import List 
+from typing import List, Dict, Tuple
 from datetime import datetime
 
+# In-process cache of yf.download results, keyed on (symbols, start, end, interval)
+_YF_CACHE: Dict[Tuple, pd.DataFrame] = {}
+
+# Symbols requested per yf.download call
+_YF_BATCH_SIZE = 50
+
 def load_data_via_yfinance_api(df:pd.DataFrame = None,
                                symbols: List[str] = None, 
                                interval = '1d')->pd.DataFrame:
@@ -63,14 +69,45 @@ def load_data_via_yfinance_api(df:pd.DataFrame = None,
     start = pd.to_datetime(start).to_pydatetime()
     end = pd.to_datetime(end).to_pydatetime()
 
-    # loading data via yf.finance
-    import yfinance as yf
     # add end offset by 1 day as yfinance will exclude the end date
     end = end + pd.DateOffset(days=1)
-    stocks = yf.download(symbols, start=start, end=end,
-                         interval=interval, auto_adjust=False)
 
-    return stocks
+    # loading data via yf.finance (repeated calls are served from the cache)
+    stocks = _yf_download_cached(tuple(symbols), start, end, interval)
+
+    # copy so callers can modify the result without touching the cache
+    return stocks.copy()
+
+
+def _yf_download_cached(symbols: Tuple[str, ...], start, end, interval) -> pd.DataFrame:
+    """
+    Downloads OHLC data via yf.download, memoised for the lifetime of the process.
+
+    Symbols are requested in batches of _YF_BATCH_SIZE; each batch uses yfinance's
+    own thread pool. Batches run one after another because yf.download keeps its
+    results in module-level state and is not safe to call concurrently.
+    Empty results (failed downloads) are not cached, so they are retried on the next call.
+    """
+    key = (symbols, start, end, interval)
+    if key not in _YF_CACHE:
+        import yfinance as yf
+        frames = [
+            yf.download(list(symbols[i:i + _YF_BATCH_SIZE]), start=start, end=end,
+                        interval=interval, auto_adjust=False,
+                        threads=True, progress=False)
+            for i in range(0, len(symbols), _YF_BATCH_SIZE)
+        ]
+        if len(frames) == 1:
+            stocks = frames[0]
+        else:
+            # same (Price, Ticker) column order as a single yf.download call
+            stocks = pd.concat(frames, axis=1).sort_index(axis=1)
+
+        if stocks.empty:
+            return stocks
+        _YF_CACHE[key] = stocks
+
+    return _YF_CACHE[key]
 
 
 # Example
@@ -0,0 +1,72 @@
+import functools
+import operator
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("zenml")
+pytest.importorskip("yfinance")
+
+from zenml_helper import DataCleaning, _strategy_fingerprint
+
+
+THRESH = 0.5
+
+
+def above_thresh(df):
+    return df[df > THRESH]
+
+
+def make_scaler(factor):
+    def scale(df):
+        return df * factor
+    return scale
+
+
+@pytest.mark.parametrize("func", [
+    functools.partial(pd.DataFrame.fillna, value=0),
+    operator.methodcaller("dropna"),
+    np.log,
+])
+def test_fingerprint_non_function_callables(func):
+    key = _strategy_fingerprint(func)
+    assert key is not None
+    assert key == _strategy_fingerprint(func)
+    DataCleaning(strategy=[func])  # must not raise
+
+
+def test_fingerprint_covers_captured_values():
+    assert _strategy_fingerprint(make_scaler(2)) != _strategy_fingerprint(make_scaler(3))
+    assert _strategy_fingerprint(make_scaler(2)) == _strategy_fingerprint(make_scaler(2))
+
+    fill_0 = functools.partial(pd.DataFrame.fillna, value=0)
+    fill_1 = functools.partial(pd.DataFrame.fillna, value=1)
+    assert _strategy_fingerprint(fill_0) != _strategy_fingerprint(fill_1)
+
+
+def test_unhashable_capture_disables_caching():
+    func = make_scaler(object())
+    assert _strategy_fingerprint(func) is None
+
+    first = DataCleaning(strategy=[func]).strategy_key
+    second = DataCleaning(strategy=[func]).strategy_key
+    assert first != second
+
+
+def test_lambdas_on_one_line_differ():
+    strategies = {"drop": lambda df: df.dropna(), "fill": lambda df: df.fillna(0)}
+    assert _strategy_fingerprint(strategies["drop"]) != _strategy_fingerprint(strategies["fill"])
+
+
+def test_fingerprint_covers_module_globals(monkeypatch):
+    before = _strategy_fingerprint(above_thresh)
+    monkeypatch.setattr(sys.modules[__name__], "THRESH", 0.75)
+    assert _strategy_fingerprint(above_thresh) != before
+
+
+def test_library_methods_are_cacheable():
+    assert _strategy_fingerprint(pd.DataFrame.dropna) is not None
+    assert DataCleaning(strategy=[pd.DataFrame.dropna]).strategy_key == \
+        DataCleaning(strategy=[pd.DataFrame.dropna]).strategy_key